@@ -124,7 +124,7 @@ def cmd_list(args):
 
 def cmd_parse_copybook(args):
     """Parse and display a copybook."""
-    parser = CopybookParser(ignore_fillers=args.no_fillers)
+    parser = CopybookParser(ignore_fillers=args.no_fillers, use_cache=args.cache)
 
     try:
         fields = parser.parse_file(args.file)
@@ -209,6 +209,9 @@ def main():
     copybook_parser.add_argument("file", help="Copybook file to parse")
     copybook_parser.add_argument("--no-fillers", action="store_true", help="Exclude FILLER fields")
     copybook_parser.add_argument("--schema", action="store_true", help="Show Spark schema")
+    copybook_parser.add_argument(
+        "--cache", action="store_true", help="Reuse cached parse results for unchanged files"
+    )
     copybook_parser.set_defaults(func=cmd_parse_copybook)
 
     # Parse DDL command
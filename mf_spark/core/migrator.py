@@ -13,6 +13,7 @@ Example:
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional, Any
 from dataclasses import dataclass, field
@@ -133,6 +134,7 @@ class MainframeMigrator:
         self,
         datasets: Optional[list[str]] = None,
         output_format: OutputFormat = OutputFormat.JSON,
+        max_workers: int = 1,
     ) -> list[DatasetResult]:
         """
         Run the migration for all configured datasets.
@@ -140,6 +142,9 @@ class MainframeMigrator:
         Args:
             datasets: Optional list of dataset names to process (None = all)
             output_format: Output format to use
+            max_workers: Number of datasets to process concurrently. Above
+                1, datasets run as concurrent jobs on one Spark session
+                using the FAIR scheduler, one pool per dataset.
 
         Returns:
             List of DatasetResult objects
@@ -156,6 +161,7 @@ class MainframeMigrator:
             ]
 
         self.summary.total_datasets = len(datasets_to_process)
+        parallel = max_workers > 1 and len(datasets_to_process) > 1
 
         print("=" * 80)
         print("MAINFRAME DATA MIGRATION")
@@ -172,25 +178,26 @@ class MainframeMigrator:
 
         # Initialize Spark session
         print("\nInitializing Spark session...")
-        self._init_spark()
+        self._init_spark(fair_scheduling=parallel)
 
         try:
-            # Process each dataset
-            for i, dataset in enumerate(datasets_to_process, 1):
-                print(f"\n[{i}/{len(datasets_to_process)}] Processing {dataset.name}...")
-                result = self._process_dataset(dataset, output_format)
-                self.summary.results.append(result)
-
-                if result.status == MigrationStatus.SUCCESS:
-                    self.summary.successful += 1
-                    self.summary.total_records += result.record_count
-                    print(f"    ✓ Success: {result.record_count:,} records")
-                elif result.status == MigrationStatus.SKIPPED:
-                    self.summary.skipped += 1
-                    print(f"    ⊘ Skipped: {result.error}")
-                else:
-                    self.summary.failed += 1
-                    print(f"    ✗ Failed: {result.error}")
+            total = len(datasets_to_process)
+            if parallel:
+                # Submit all datasets, then record results in dataset order
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(self._process_dataset_in_pool, dataset, output_format)
+                        for dataset in datasets_to_process
+                    ]
+                    print(f"\nProcessing {total} datasets with {max_workers} workers...")
+                    for i, (dataset, future) in enumerate(zip(datasets_to_process, futures), 1):
+                        print(f"\n[{i}/{total}] {dataset.name}:")
+                        self._record_result(future.result())
+            else:
+                # Process each dataset
+                for i, dataset in enumerate(datasets_to_process, 1):
+                    print(f"\n[{i}/{total}] Processing {dataset.name}...")
+                    self._record_result(self._process_dataset(dataset, output_format))
 
             # Generate manifest
             if self.config.generate_manifest:
@@ -238,14 +245,39 @@ class MainframeMigrator:
 
         return self.run(datasets=[output_name])[0]
 
-    def _init_spark(self) -> None:
-        """Initialize the Spark session."""
+    def _record_result(self, result: DatasetResult) -> None:
+        """Add a dataset result to the summary and report it."""
+        self.summary.results.append(result)
+
+        if result.status == MigrationStatus.SUCCESS:
+            self.summary.successful += 1
+            self.summary.total_records += result.record_count
+            print(f"    ✓ Success: {result.record_count:,} records")
+        elif result.status == MigrationStatus.SKIPPED:
+            self.summary.skipped += 1
+            print(f"    ⊘ Skipped: {result.error}")
+        else:
+            self.summary.failed += 1
+            print(f"    ✗ Failed: {result.error}")
+
+    def _init_spark(self, fair_scheduling: bool = False) -> None:
+        """
+        Initialize the Spark session.
+
+        Args:
+            fair_scheduling: Use the FAIR scheduler so concurrent dataset
+                jobs share executors instead of queueing
+        """
+        extra_configs = self.config.extra_spark_configs
+        if fair_scheduling:
+            extra_configs = {"spark.scheduler.mode": "FAIR", **extra_configs}
+
         self.session_manager = SparkSessionManager(
             app_name=self.config.spark_app_name,
             master=self.config.spark_master,
             cobrix_version=self.config.cobrix_version,
             enable_cobrix=True,
-            extra_configs=self.config.extra_spark_configs,
+            extra_configs=extra_configs,
         )
         self._spark = self.session_manager.get_or_create()
 
@@ -255,6 +287,25 @@ class MainframeMigrator:
             self.session_manager.stop()
             self._spark = None
 
+    def _process_dataset_in_pool(
+        self,
+        dataset: DatasetDefinition,
+        output_format: OutputFormat,
+    ) -> DatasetResult:
+        """
+        Process a dataset from a worker thread in its own scheduler pool.
+
+        Args:
+            dataset: Dataset definition
+            output_format: Output format
+
+        Returns:
+            DatasetResult with processing details
+        """
+        # Local properties are per thread, so this only tags this dataset's jobs
+        self._spark.sparkContext.setLocalProperty("spark.scheduler.pool", dataset.name)
+        return self._process_dataset(dataset, output_format)
+
     def _process_dataset(
         self,
         dataset: DatasetDefinition,
@@ -20,14 +20,45 @@ Supported Features:
 """
 
 import re
+import mmap
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 from pathlib import Path
 
 from mf_spark.converters.vsam_types import VSAMTypeConverter
+from mf_spark.utils.parallel import parse_files
+from mf_spark.utils.parse_cache import ParseCache
+from mf_spark.utils.type_mapping import spark_type
 
 
-@dataclass
+# On-disk cache of parsed copybooks
+_PARSE_CACHE = ParseCache("copybook", modules=[__name__, VSAMTypeConverter.__module__])
+
+# Inline comment: everything from the first "*" to end of line
+_CONT_STRIP = re.compile(r"\*.*$")
+
+# Non-blank source line, split into sequence area (columns 1-6),
+# indicator (column 7) and body; lines shorter than 7 columns are
+# captured whole
+_LINE_RE = re.compile(
+    r"^(?=.*\S)"
+    r"(?:.{6}(?P<indicator>.)(?P<body>.*)|(?P<short>.{1,6}))$",
+    re.MULTILINE
+)
+
+# Raw comment line (indicator "*" in column 7) including its line end.
+# The sequence area must be single-byte so byte and character columns agree
+_COMMENT_LINE_BYTES = re.compile(
+    rb"(?:\A|(?<=[\r\n]))[^\r\n\x80-\xff]{6}\*[^\r\n]*(?:\r\n|\r|\n|\Z)"
+)
+
+
+def _upper_fast(text: str) -> str:
+    """Uppercase text, skipping the copy when it is already uppercase."""
+    return text if text.isupper() else text.upper()
+
+
+@dataclass(slots=True)
 class CopybookField:
     """
     Represents a field definition from a COBOL copybook.
@@ -44,6 +75,7 @@ class CopybookField:
         redefines: Name of field this redefines
         parent: Parent field name for nested structures
         children: Child field names for group items
+        is_elementary: Whether this is an elementary item (has PIC clause)
     """
     name: str
     level: int
@@ -56,11 +88,7 @@ class CopybookField:
     redefines: Optional[str] = None
     parent: Optional[str] = None
     children: list[str] = field(default_factory=list)
-
-    @property
-    def is_elementary(self) -> bool:
-        """Check if this is an elementary item (has PIC clause)."""
-        return self.pic_clause is not None and not self.is_group
+    is_elementary: bool = False
 
     @property
     def total_length(self) -> int:
@@ -108,25 +136,15 @@ class CopybookParser:
         re.IGNORECASE
     )
 
-    PIC_PATTERN = re.compile(
-        r"PIC(?:TURE)?\s+"
-        r"(S)?([XA9]+(?:\(\d+\))?)"           # Base type with optional length
-        r"(?:V([9]+(?:\(\d+\))?))?",          # Optional decimal
-        re.IGNORECASE
-    )
-
-    OCCURS_PATTERN = re.compile(
-        r"OCCURS\s+(\d+)",
-        re.IGNORECASE
-    )
-
-    REDEFINES_PATTERN = re.compile(
-        r"REDEFINES\s+([\w-]+)",
-        re.IGNORECASE
-    )
-
-    COMP_PATTERN = re.compile(
-        r"(COMP(?:-[1-5])?)",
+    # Single-pass scanner for the REDEFINES, OCCURS, PIC and COMP clauses
+    # following the field name
+    _REST_SCANNER = re.compile(
+        r"(?P<redefines>REDEFINES\s+(?P<redefines_name>[\w-]+))"
+        r"|(?P<occurs>OCCURS\s+(?P<occurs_count>\d+))"
+        r"|(?P<pic>PIC(?:TURE)?\s+"
+        r"(?P<sign>S)?(?P<integer>[XA9]+(?:\(\d+\))?)"
+        r"(?:V(?P<decimal>[9]+(?:\(\d+\))?))?)"
+        r"|(?P<comp>COMP(?:-[1-5])?)",
         re.IGNORECASE
     )
 
@@ -134,6 +152,7 @@ class CopybookParser:
         self,
         ignore_fillers: bool = False,
         default_encoding: str = "cp037",
+        use_cache: bool = False,
     ):
         """
         Initialize the copybook parser.
@@ -141,10 +160,14 @@ class CopybookParser:
         Args:
             ignore_fillers: Whether to exclude FILLER fields
             default_encoding: EBCDIC encoding for string fields
+            use_cache: Reuse on-disk parse results for unchanged files
+                (off by default; see ParseCache)
         """
         self.ignore_fillers = ignore_fillers
         self.default_encoding = default_encoding
+        self.use_cache = use_cache
         self.type_converter = VSAMTypeConverter(default_encoding=default_encoding)
+        self._len_cache: dict[str, int] = {}  # PIC clause -> storage bytes
 
     def parse_file(self, filepath: str) -> list[CopybookField]:
         """
@@ -163,8 +186,42 @@ class CopybookParser:
         if not path.exists():
             raise FileNotFoundError(f"Copybook not found: {filepath}")
 
-        content = path.read_text(encoding="utf-8", errors="replace")
-        return self.parse_content(content)
+        cache_key = None
+        if self.use_cache:
+            cache_key = _PARSE_CACHE.key(path, self.ignore_fillers, self.default_encoding)
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
+        content = self._read_source(path)
+        fields = self.parse_content(content)
+
+        if self.use_cache:
+            _PARSE_CACHE.put(cache_key, fields)
+
+        return fields
+
+    def parse_files(
+        self,
+        filepaths: list[str],
+        max_workers: Optional[int] = None,
+    ) -> dict[str, list[CopybookField]]:
+        """
+        Parse several copybook files, in parallel when the input is large.
+
+        See mf_spark.utils.parallel.parse_files.
+
+        Args:
+            filepaths: Paths to the copybook files
+            max_workers: Maximum worker processes (default: CPU count)
+
+        Returns:
+            Dict of file path -> list of CopybookField objects
+
+        Raises:
+            FileNotFoundError: If any of the files doesn't exist
+        """
+        return parse_files(self.parse_file, filepaths, max_workers)
 
     def parse_content(self, content: str) -> list[CopybookField]:
         """
@@ -177,23 +234,30 @@ class CopybookParser:
             List of CopybookField objects
         """
         fields = []
+        by_name = {}  # Most recent field with each name, for REDEFINES
         current_offset = 0
-        parent_stack = []  # Stack of (level, name, offset) for hierarchy
-
-        # Clean and normalize content
-        lines = self._clean_content(content)
-
-        for line in lines:
-            field = self._parse_line(line)
+        parent_stack = []  # Stack of (level, field) for hierarchy
+
+        # Bind per-field methods once, outside the loop
+        append_field = fields.append
+        push_parent = parent_stack.append
+        pop_parent = parent_stack.pop
+        parse_line = self._parse_line
+        calculate_length = self._calculate_length
+        ignore_fillers = self.ignore_fillers
+
+        # Clean, normalize and parse each statement as it is produced
+        for line in self._iter_clean_lines(content):
+            field = parse_line(line)
             if field is None:
                 continue
 
             # Handle hierarchy using level numbers
             while parent_stack and parent_stack[-1][0] >= field.level:
-                parent_stack.pop()
+                pop_parent()
 
             if parent_stack:
-                field.parent = parent_stack[-1][1]
+                field.parent = parent_stack[-1][1].name
                 # Don't reset offset for group items
                 if field.is_group:
                     field.offset = current_offset
@@ -203,85 +267,118 @@ class CopybookParser:
             # Calculate offset for elementary items
             if field.is_elementary:
                 field.offset = current_offset
-                field.length = self._calculate_length(field.pic_clause)
-                current_offset += field.total_length
+                field.length = calculate_length(field.pic_clause)
+                current_offset += field.length * field.occurs
 
             # Handle REDEFINES (overlay on previous field)
             if field.redefines:
                 # Find the redefined field and use its offset
-                for f in reversed(fields):
-                    if f.name == field.redefines:
-                        field.offset = f.offset
-                        break
+                target = by_name.get(field.redefines)
+                if target is not None:
+                    field.offset = target.offset
                 # Don't advance offset for REDEFINES
 
             # Add to parent's children if applicable
             if parent_stack:
-                for f in reversed(fields):
-                    if f.name == parent_stack[-1][1]:
-                        f.children.append(field.name)
-                        break
+                parent_stack[-1][1].children.append(field.name)
 
             # Push group items onto parent stack
             if field.is_group:
-                parent_stack.append((field.level, field.name, field.offset))
+                push_parent((field.level, field))
 
             # Apply filter and add to results
-            if not (self.ignore_fillers and field.is_filler):
-                fields.append(field)
+            if not (ignore_fillers and field.is_filler):
+                append_field(field)
+                by_name[field.name] = field
 
         return fields
 
-    def _clean_content(self, content: str) -> list[str]:
+    def _read_source(self, path: Path) -> str:
+        """
+        Read copybook source, dropping comment lines before decoding.
+
+        The file is memory-mapped and scanned at the byte level so that
+        comment blocks, often the bulk of a copybook, are never decoded.
+
+        Args:
+            path: Path to the copybook file
+
+        Returns:
+            Copybook content without full-line comments
+        """
+        with path.open("rb") as f:
+            # mmap cannot map an empty file
+            if path.stat().st_size == 0:
+                return ""
+
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                pieces = []
+                start = 0
+                for match in _COMMENT_LINE_BYTES.finditer(mm):
+                    if match.start() > start:
+                        pieces.append(mm[start:match.start()].decode("utf-8", errors="replace"))
+                    start = match.end()
+                pieces.append(mm[start:].decode("utf-8", errors="replace"))
+                content = "".join(pieces)
+            finally:
+                mm.close()
+
+        # Universal newlines, as read_text() would apply
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        return content
+
+    def _iter_clean_lines(self, content: str) -> Iterator[str]:
         """
-        Clean and normalize copybook content.
+        Clean and normalize copybook content, yielding one statement at a time.
 
         Removes comments, handles line continuations, and normalizes whitespace.
         """
-        lines = []
-        current_line = ""
+        current_line = []  # Pieces of a statement spanning several lines
 
-        for line in content.split("\n"):
-            # Skip empty lines
-            if not line.strip():
-                continue
+        for match in _LINE_RE.finditer(content):
+            indicator = match.group("indicator")
 
             # Handle sequence numbers (columns 1-6) and indicator (column 7)
-            if len(line) >= 7:
-                indicator = line[6] if len(line) > 6 else " "
+            if indicator is not None:
                 # Skip comment lines (indicator = *)
                 if indicator == "*":
                     continue
                 # Handle continuation lines (indicator = -)
                 if indicator == "-":
-                    current_line = current_line.rstrip() + line[7:].lstrip()
+                    if current_line:
+                        current_line[-1] = current_line[-1].rstrip()
+                    current_line.append(match.group("body").lstrip())
                     continue
                 # Take content from columns 8-72
-                line_content = line[7:72] if len(line) > 7 else ""
+                line_content = match.group("body")[:65]
             else:
-                line_content = line
+                line_content = match.group("short")
 
             # If we have a pending continuation, complete it
             if current_line:
-                lines.append(current_line)
-                current_line = ""
+                pending = "".join(current_line)
+                if pending:
+                    yield pending
+                current_line = []
 
             # Remove inline comments (text after *)
             if "*" in line_content:
-                line_content = line_content.split("*")[0]
+                line_content = _CONT_STRIP.sub("", line_content, count=1)
 
             line_content = line_content.strip()
             if line_content:
                 # Handle multi-line statements (ends with period)
                 if line_content.endswith("."):
-                    lines.append(line_content)
+                    yield line_content
                 else:
-                    current_line = line_content
+                    current_line = [line_content]
 
         if current_line:
-            lines.append(current_line)
-
-        return lines
+            pending = "".join(current_line)
+            if pending:
+                yield pending
 
     def _parse_line(self, line: str) -> Optional[CopybookField]:
         """
@@ -302,7 +399,7 @@ class CopybookParser:
             return None
 
         level = int(match.group(1))
-        name = match.group(2).upper()
+        name = _upper_fast(match.group(2))
         rest = match.group(3)
 
         # Skip level 66 (RENAMES) and level 88 (condition names)
@@ -312,25 +409,38 @@ class CopybookParser:
         # Check for FILLER
         is_filler = name == "FILLER"
 
+        # Scan REDEFINES, OCCURS, PIC and COMP clauses in one pass,
+        # keeping the first occurrence of each. Group items ("05 NAME.")
+        # have nothing after the name, so skip the scan for them
+        redefines_match = occurs_match = pic_match = comp_match = None
+        if rest:
+            for clause in self._REST_SCANNER.finditer(rest):
+                kind = clause.lastgroup
+                if kind == "redefines" and redefines_match is None:
+                    redefines_match = clause
+                elif kind == "occurs" and occurs_match is None:
+                    occurs_match = clause
+                elif kind == "pic" and pic_match is None:
+                    pic_match = clause
+                elif kind == "comp" and comp_match is None:
+                    comp_match = clause
+
         # Check for REDEFINES
         redefines = None
-        redefines_match = self.REDEFINES_PATTERN.search(rest)
         if redefines_match:
-            redefines = redefines_match.group(1).upper()
+            redefines = _upper_fast(redefines_match.group("redefines_name"))
 
         # Check for OCCURS
         occurs = 1
-        occurs_match = self.OCCURS_PATTERN.search(rest)
         if occurs_match:
-            occurs = int(occurs_match.group(1))
+            occurs = int(occurs_match.group("occurs_count"))
 
         # Check for PIC clause
         pic_clause = None
-        pic_match = self.PIC_PATTERN.search(rest)
         if pic_match:
-            sign = pic_match.group(1) or ""
-            integer_part = pic_match.group(2)
-            decimal_part = pic_match.group(3) or ""
+            sign = pic_match.group("sign") or ""
+            integer_part = pic_match.group("integer")
+            decimal_part = pic_match.group("decimal") or ""
 
             # Reconstruct PIC clause
             pic_clause = f"PIC {sign}{integer_part}"
@@ -338,12 +448,12 @@ class CopybookParser:
                 pic_clause += f"V{decimal_part}"
 
             # Check for COMP modifier
-            comp_match = self.COMP_PATTERN.search(rest)
             if comp_match:
-                pic_clause += f" {comp_match.group(1).upper()}"
+                pic_clause += f" {_upper_fast(comp_match.group('comp'))}"
 
         # Determine if this is a group item (no PIC clause)
         is_group = pic_clause is None and not is_filler
+        is_elementary = pic_clause is not None and not is_group
 
         return CopybookField(
             name=name,
@@ -353,12 +463,17 @@ class CopybookParser:
             is_group=is_group,
             occurs=occurs,
             redefines=redefines,
+            is_elementary=is_elementary,
         )
 
     def _calculate_length(self, pic_clause: Optional[str]) -> int:
         """
         Calculate the storage length for a PIC clause.
 
+        Lengths are memoized per PIC clause in a plain dict rather than an
+        lru_cache-wrapped bound method, which would make the parser
+        unpicklable for parse_files().
+
         Args:
             pic_clause: COBOL PIC clause
 
@@ -368,7 +483,11 @@ class CopybookParser:
         if not pic_clause:
             return 0
 
-        return self.type_converter.get_storage_bytes(pic_clause)
+        length = self._len_cache.get(pic_clause)
+        if length is None:
+            length = self.type_converter.get_storage_bytes(pic_clause)
+            self._len_cache[pic_clause] = length
+        return length
 
     def get_elementary_fields(self, fields: list[CopybookField]) -> list[CopybookField]:
         """
@@ -392,12 +511,10 @@ class CopybookParser:
         Returns:
             Total record length in bytes
         """
-        max_offset = 0
-        for f in fields:
-            if f.is_elementary:
-                end_offset = f.offset + f.total_length
-                max_offset = max(max_offset, end_offset)
-        return max_offset
+        return max(
+            (f.offset + f.length * f.occurs for f in fields if f.is_elementary),
+            default=0,
+        )
 
     def to_spark_schema(self, fields: list[CopybookField]):
         """
@@ -411,12 +528,13 @@ class CopybookParser:
         """
         from pyspark.sql.types import StructType, StructField
 
-        schema_fields = []
-        for f in self.get_elementary_fields(fields):
-            spark_type = self.type_converter.convert(f.pic_clause)
-            schema_fields.append(StructField(f.name, spark_type, nullable=True))
+        elementary = self.get_elementary_fields(fields)
 
-        return StructType(schema_fields)
+        converter = self.type_converter
+        return StructType([
+            StructField(f.name, spark_type(converter, f.pic_clause), nullable=True)
+            for f in elementary
+        ])
 
     def print_layout(self, fields: list[CopybookField]) -> str:
         """
@@ -435,13 +553,19 @@ class CopybookParser:
         lines.append(f"{'Offset':<8} {'Length':<8} {'Level':<6} {'Name':<30} {'PIC Clause'}")
         lines.append("-" * 80)
 
-        for f in fields:
-            if f.is_filler and self.ignore_fillers:
-                continue
-            indent = "  " * (f.level // 5)
-            name = indent + f.name
-            pic = f.pic_clause or "(GROUP)"
-            lines.append(f"{f.offset:<8} {f.length:<8} {f.level:<6} {name:<30} {pic}")
+        shown = fields
+        if self.ignore_fillers:
+            shown = [f for f in fields if not f.is_filler]
+
+        for f in shown:
+            name = "  " * (f.level // 5) + f.name
+            lines.append(" ".join((
+                str(f.offset).ljust(8),
+                str(f.length).ljust(8),
+                str(f.level).ljust(6),
+                name.ljust(30),
+                f.pic_clause or "(GROUP)",
+            )))
 
         lines.append("-" * 80)
         lines.append(f"Total Record Length: {self.get_record_length(fields)} bytes")
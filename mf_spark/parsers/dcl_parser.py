@@ -25,9 +25,16 @@ from pathlib import Path
 from mf_spark.parsers.ddl_parser import DDLColumn
 from mf_spark.converters.db2_types import DB2TypeConverter
 from mf_spark.converters.vsam_types import VSAMTypeConverter
+from mf_spark.utils.parallel import parse_files
+from mf_spark.utils.parse_cache import ParseCache
+from mf_spark.utils.type_mapping import spark_type
 
 
-@dataclass
+# On-disk cache of parsed DCLGEN files
+_PARSE_CACHE = ParseCache("dcl", modules=[__name__, DDLColumn.__module__])
+
+
+@dataclass(slots=True)
 class CobolHostVariable:
     """
     Represents a COBOL host variable from DCLGEN output.
@@ -53,7 +60,7 @@ class CobolHostVariable:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DCLGenResult:
     """
     Result of parsing a DCLGEN file.
@@ -103,19 +110,28 @@ class DCLParser:
         ...     print(f"{col.name} ({col.data_type}) -> {var.name}")
     """
 
-    # Pattern for EXEC SQL DECLARE TABLE
+    # Pattern for the head of EXEC SQL DECLARE TABLE, up to the open paren
     DECLARE_PATTERN = re.compile(
         r"EXEC\s+SQL\s+DECLARE\s+"
         r"(\w+(?:\.\w+)?)\s+TABLE\s*"  # Table name
-        r"\((.*?)\)\s*END-EXEC",       # Column definitions
-        re.IGNORECASE | re.DOTALL
+        r"\(",
+        re.IGNORECASE
+    )
+
+    # Pattern for the close paren ending the DECLARE column list
+    DECLARE_END_PATTERN = re.compile(
+        r"\)\s*END-EXEC",
+        re.IGNORECASE
     )
 
-    # Pattern for SQL column in DECLARE
+    # Pattern for one comma-separated item in DECLARE; the trailing part
+    # consumes the rest of the item so successive matches are contiguous
     SQL_COLUMN_PATTERN = re.compile(
-        r"(\w+)\s+"                    # Column name
+        r"(?:^|,)\s*"
+        r"(?:(\w+)\s+"                 # Column name
         r"([A-Z]+(?:\s*\([^)]+\))?)"   # Data type
-        r"(\s+NOT\s+NULL)?",           # NOT NULL
+        r"(\s+NOT\s+NULL)?)?"          # NOT NULL
+        r"(?:[^,(]|\([^)]*\))*",        # Remainder of the item
         re.IGNORECASE
     )
 
@@ -126,13 +142,13 @@ class DCLParser:
         re.IGNORECASE | re.DOTALL
     )
 
-    # Pattern for COBOL field
+    # Pattern for COBOL field, anchored to the start of a line
     COBOL_FIELD_PATTERN = re.compile(
-        r"(\d{2})\s+([\w-]+)"          # Level and name
+        r"^\s*(\d{2})\s+([\w-]+)"      # Level and name
         r"(?:\s+PIC\s+([^\s.]+))?"     # Optional PIC clause
         r"(?:\s+(COMP(?:-[1-5])?))?"   # Optional COMP
         r"(?:\s+USAGE\s+(\w+))?",      # Optional USAGE
-        re.IGNORECASE
+        re.IGNORECASE | re.MULTILINE
     )
 
     # Pattern for column count comment
@@ -141,8 +157,15 @@ class DCLParser:
         re.IGNORECASE
     )
 
-    def __init__(self):
-        """Initialize the DCL parser."""
+    def __init__(self, use_cache: bool = False):
+        """
+        Initialize the DCL parser.
+
+        Args:
+            use_cache: Reuse on-disk parse results for unchanged files
+                (off by default; see ParseCache)
+        """
+        self.use_cache = use_cache
         self.db2_converter = DB2TypeConverter()
         self.vsam_converter = VSAMTypeConverter()
 
@@ -163,8 +186,42 @@ class DCLParser:
         if not path.exists():
             raise FileNotFoundError(f"DCL file not found: {filepath}")
 
+        cache_key = None
+        if self.use_cache:
+            cache_key = _PARSE_CACHE.key(path)
+            cached = _PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+
         content = path.read_text(encoding="utf-8", errors="replace")
-        return self.parse_content(content)
+        result = self.parse_content(content)
+
+        if self.use_cache:
+            _PARSE_CACHE.put(cache_key, result)
+
+        return result
+
+    def parse_files(
+        self,
+        filepaths: list[str],
+        max_workers: Optional[int] = None,
+    ) -> dict[str, DCLGenResult]:
+        """
+        Parse several DCL files, in parallel when the input is large.
+
+        See mf_spark.utils.parallel.parse_files.
+
+        Args:
+            filepaths: Paths to the DCL files
+            max_workers: Maximum worker processes (default: CPU count)
+
+        Returns:
+            Dict of file path -> DCLGenResult with parsed definitions
+
+        Raises:
+            FileNotFoundError: If any of the files doesn't exist
+        """
+        return parse_files(self.parse_file, filepaths, max_workers)
 
     def parse_content(self, content: str) -> DCLGenResult:
         """
@@ -179,9 +236,9 @@ class DCLParser:
         result = DCLGenResult(table_name="")
 
         # Parse EXEC SQL DECLARE
-        declare_match = self.DECLARE_PATTERN.search(content)
-        if declare_match:
-            table_name = declare_match.group(1)
+        declare = self._find_declare(content)
+        if declare:
+            table_name, columns_content = declare
             result.table_name = table_name
 
             # Split schema and table
@@ -191,7 +248,6 @@ class DCLParser:
                 result.table = table_name
 
             # Parse columns
-            columns_content = declare_match.group(2)
             result.sql_columns = self._parse_sql_columns(columns_content)
 
         # Parse COBOL record
@@ -209,6 +265,30 @@ class DCLParser:
 
         return result
 
+    def _find_declare(self, content: str) -> Optional[tuple[str, str]]:
+        """
+        Locate the EXEC SQL DECLARE TABLE statement.
+
+        The head and the closing ") END-EXEC" are found with two forward
+        searches, so the column list is never matched by a lazy
+        whole-file wildcard.
+
+        Args:
+            content: Full DCL content
+
+        Returns:
+            Tuple of (table_name, columns_content), or None if not found
+        """
+        head = self.DECLARE_PATTERN.search(content)
+        if not head:
+            return None
+
+        end = self.DECLARE_END_PATTERN.search(content, head.end())
+        if not end:
+            return None
+
+        return head.group(1), content[head.end():end.start()]
+
     def _parse_sql_columns(self, content: str) -> list[DDLColumn]:
         """
         Parse SQL column definitions from DECLARE statement.
@@ -221,25 +301,19 @@ class DCLParser:
         """
         columns = []
 
-        # Split by comma, handling nested parentheses
-        parts = self._split_by_comma(content)
-
-        for part in parts:
-            part = part.strip()
-            if not part:
+        for match in self.SQL_COLUMN_PATTERN.finditer(content):
+            if match.group(1) is None:
                 continue
 
-            match = self.SQL_COLUMN_PATTERN.match(part)
-            if match:
-                name = match.group(1).upper()
-                data_type = match.group(2).strip().upper()
-                not_null = match.group(3) is not None
+            name = match.group(1).upper()
+            data_type = match.group(2).strip().upper()
+            not_null = match.group(3) is not None
 
-                columns.append(DDLColumn(
-                    name=name,
-                    data_type=data_type,
-                    nullable=not not_null,
-                ))
+            columns.append(DDLColumn(
+                name=name,
+                data_type=data_type,
+                nullable=not not_null,
+            ))
 
         return columns
 
@@ -255,41 +329,33 @@ class DCLParser:
         """
         variables = []
 
-        # Find all COBOL field definitions
+        # Find all COBOL field definitions in one pass
         # Look for patterns like "10 DCL-FIELD-NAME PIC X(10)."
-        lines = content.split("\n")
-        for line in lines:
-            # Clean line
-            line = line.strip()
-            if not line:
+        for match in self.COBOL_FIELD_PATTERN.finditer(content):
+            level = int(match.group(1))
+            name = match.group(2).upper()
+
+            # Skip level 01 (record name)
+            if level == 1:
+                continue
+
+            # Skip level 49 (VARCHAR length field)
+            if level == 49:
                 continue
 
-            match = self.COBOL_FIELD_PATTERN.search(line)
-            if match:
-                level = int(match.group(1))
-                name = match.group(2).upper()
-
-                # Skip level 01 (record name)
-                if level == 1:
-                    continue
-
-                # Skip level 49 (VARCHAR length field)
-                if level == 49:
-                    continue
-
-                pic_clause = None
-                if match.group(3):
-                    pic_clause = f"PIC {match.group(3)}"
-                    if match.group(4):  # COMP modifier
-                        pic_clause += f" {match.group(4)}"
-                    elif match.group(5):  # USAGE
-                        pic_clause += f" {match.group(5)}"
-
-                variables.append(CobolHostVariable(
-                    name=name,
-                    level=level,
-                    pic_clause=pic_clause,
-                ))
+            pic_clause = None
+            if match.group(3):
+                pic_clause = f"PIC {match.group(3)}"
+                if match.group(4):  # COMP modifier
+                    pic_clause += f" {match.group(4)}"
+                elif match.group(5):  # USAGE
+                    pic_clause += f" {match.group(5)}"
+
+            variables.append(CobolHostVariable(
+                name=name,
+                level=level,
+                pic_clause=pic_clause,
+            ))
 
         return variables
 
@@ -301,6 +367,8 @@ class DCLParser:
         SQL column: COLUMN_NAME
         COBOL var:  DCL-COLUMN-NAME
         """
+        column_names = {col.name for col in result.sql_columns}
+
         for var in result.host_variables:
             # Convert COBOL name to potential SQL name
             # Remove DCL- prefix and convert hyphens to underscores
@@ -310,34 +378,8 @@ class DCLParser:
             sql_name = sql_name.replace("-", "_")
 
             # Find matching SQL column
-            for col in result.sql_columns:
-                if col.name == sql_name:
-                    var.sql_column = col.name
-                    break
-
-    def _split_by_comma(self, content: str) -> list[str]:
-        """Split content by comma, respecting parentheses."""
-        parts = []
-        current = ""
-        paren_depth = 0
-
-        for char in content:
-            if char == "(":
-                paren_depth += 1
-                current += char
-            elif char == ")":
-                paren_depth -= 1
-                current += char
-            elif char == "," and paren_depth == 0:
-                parts.append(current.strip())
-                current = ""
-            else:
-                current += char
-
-        if current.strip():
-            parts.append(current.strip())
-
-        return parts
+            if sql_name in column_names:
+                var.sql_column = sql_name
 
     def to_spark_schema(self, result: DCLGenResult):
         """
@@ -351,12 +393,11 @@ class DCLParser:
         """
         from pyspark.sql.types import StructType, StructField
 
-        fields = []
-        for col in result.sql_columns:
-            spark_type = self.db2_converter.convert(col.data_type)
-            fields.append(StructField(col.name, spark_type, nullable=col.nullable))
-
-        return StructType(fields)
+        converter = self.db2_converter
+        return StructType([
+            StructField(col.name, spark_type(converter, col.data_type), nullable=col.nullable)
+            for col in result.sql_columns
+        ])
 
     def print_mapping(self, result: DCLGenResult) -> str:
         """
@@ -368,6 +409,12 @@ class DCLParser:
         Returns:
             Formatted string showing the mapping
         """
+        # Index host variables by SQL column, keeping the first match
+        by_column = {}
+        for var in result.host_variables:
+            if var.sql_column:
+                by_column.setdefault(var.sql_column, var)
+
         lines = []
         lines.append("=" * 80)
         lines.append(f"DCLGEN MAPPING: {result.table_name}")
@@ -377,13 +424,9 @@ class DCLParser:
 
         for col in result.sql_columns:
             # Find matching COBOL variable
-            cobol_name = ""
-            pic = ""
-            for var in result.host_variables:
-                if var.sql_column == col.name:
-                    cobol_name = var.name
-                    pic = var.pic_clause or ""
-                    break
+            var = by_column.get(col.name)
+            cobol_name = var.name if var else ""
+            pic = (var.pic_clause if var else "") or ""
 
             lines.append(f"{col.name:<25} {col.data_type:<20} {cobol_name:<25} {pic}")
 
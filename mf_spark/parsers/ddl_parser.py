@@ -23,9 +23,18 @@ from typing import Optional
 from pathlib import Path
 
 from mf_spark.converters.db2_types import DB2TypeConverter
+from mf_spark.utils.type_mapping import spark_type
 
 
-@dataclass
+# Patterns used while cleaning content and parsing columns
+_COMMENTS_RE = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_PUNCTUATION_RE = re.compile(r"[(),]")
+
+# DB2TypeConverter holds no per-parse state, so parsers share one instance
+_TYPE_CONVERTER = DB2TypeConverter()
+
+
+@dataclass(slots=True)
 class DDLColumn:
     """
     Represents a column definition from a DB2 DDL statement.
@@ -57,7 +66,7 @@ class DDLColumn:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DDLTable:
     """
     Represents a table definition from a DB2 DDL statement.
@@ -116,10 +125,10 @@ class DDLParser:
     )
 
     COLUMN_PATTERN = re.compile(
-        r"(\w+)\s+"              # Column name
-        r"([A-Z]+(?:\s*\([^)]+\))?(?:\s+FOR\s+BIT\s+DATA)?)"  # Data type
-        r"(\s+NOT\s+NULL)?"      # NOT NULL
-        r"(\s+WITH\s+DEFAULT\s+[^,]+)?",  # DEFAULT
+        r"(?P<name>\w+)\s+"                  # Column name
+        r"(?P<data_type>[A-Z]+(?:\s*\([^)]+\))?(?:\s+FOR\s+BIT\s+DATA)?)"  # Data type
+        r"(?P<not_null>\s+NOT\s+NULL)?"      # NOT NULL
+        r"(?:\s+WITH\s+DEFAULT\s+(?P<default>[^,]+))?",  # DEFAULT value
         re.IGNORECASE
     )
 
@@ -136,7 +145,7 @@ class DDLParser:
 
     def __init__(self):
         """Initialize the DDL parser."""
-        self.type_converter = DB2TypeConverter()
+        self.type_converter = _TYPE_CONVERTER
 
     def parse_file(self, filepath: str) -> DDLTable:
         """
@@ -220,11 +229,13 @@ class DDLParser:
                 columns.append(col)
 
         # Update primary key and foreign key flags on columns
+        primary_key_set = set(primary_key)
         for col in columns:
-            if col.name in primary_key:
+            if col.name in primary_key_set:
                 col.is_primary_key = True
-            if col.name in foreign_keys:
-                col.foreign_key_ref = foreign_keys[col.name]
+            ref = foreign_keys.get(col.name)
+            if ref is not None:
+                col.foreign_key_ref = ref
 
         return DDLTable(
             schema=schema,
@@ -240,9 +251,8 @@ class DDLParser:
 
         Removes comments and normalizes whitespace.
         """
-        # Remove SQL comments
-        content = re.sub(r"--.*$", "", content, flags=re.MULTILINE)
-        content = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
+        # Remove SQL comments, whichever kind starts first
+        content = _COMMENTS_RE.sub("", content)
 
         # Normalize whitespace
         content = " ".join(content.split())
@@ -260,24 +270,24 @@ class DDLParser:
             List of individual column/constraint definitions
         """
         parts = []
-        current = ""
+        start = 0
         paren_depth = 0
 
-        for char in content:
+        # Only parentheses and commas affect splitting, so track depth over
+        # those and slice the text between top-level commas
+        for match in _PUNCTUATION_RE.finditer(content):
+            char = match.group()
             if char == "(":
                 paren_depth += 1
-                current += char
             elif char == ")":
                 paren_depth -= 1
-                current += char
-            elif char == "," and paren_depth == 0:
-                parts.append(current.strip())
-                current = ""
-            else:
-                current += char
+            elif paren_depth == 0:
+                parts.append(content[start:match.start()].strip())
+                start = match.end()
 
-        if current.strip():
-            parts.append(current.strip())
+        last = content[start:].strip()
+        if last:
+            parts.append(last)
 
         return parts
 
@@ -295,20 +305,14 @@ class DDLParser:
         if not match:
             return None
 
-        name = match.group(1).upper()
-        data_type = match.group(2).strip().upper()
-        not_null = match.group(3) is not None
-        default_clause = match.group(4)
-
-        default_value = None
-        if default_clause:
-            default_value = default_clause.strip()
-            default_value = re.sub(r"^\s*WITH\s+DEFAULT\s*", "", default_value, flags=re.IGNORECASE)
+        default_value = match.group("default")
+        if default_value:
+            default_value = default_value.rstrip()
 
         return DDLColumn(
-            name=name,
-            data_type=data_type,
-            nullable=not not_null,
+            name=match.group("name").upper(),
+            data_type=match.group("data_type").upper(),
+            nullable=match.group("not_null") is None,
             default_value=default_value,
         )
 
@@ -324,12 +328,11 @@ class DDLParser:
         """
         from pyspark.sql.types import StructType, StructField
 
-        fields = []
-        for col in table.columns:
-            spark_type = self.type_converter.convert(col.data_type)
-            fields.append(StructField(col.name, spark_type, nullable=col.nullable))
-
-        return StructType(fields)
+        converter = self.type_converter
+        return StructType([
+            StructField(col.name, spark_type(converter, col.data_type), nullable=col.nullable)
+            for col in table.columns
+        ])
 
     def print_table_definition(self, table: DDLTable) -> str:
         """
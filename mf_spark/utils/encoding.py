@@ -11,6 +11,7 @@ Example:
     Hello
 """
 
+import struct
 from typing import Optional
 from decimal import Decimal
 
@@ -39,6 +40,36 @@ CCSID_CODECS = {
     297: "cp297",     # French
 }
 
+# Single-byte EBCDIC codecs, where each input byte decodes to one character
+_SBCS_CODECS = frozenset({
+    "cp037", "cp500", "cp1047", "cp1140", "cp273", "cp284", "cp285", "cp297",
+})
+
+# Python codec to Java charset name, for decoding inside the JVM. UTF-16
+# is left out: without a BOM Java reads it big-endian, Python in native order
+_JAVA_CHARSETS = {
+    "cp037": "IBM037",
+    "cp500": "IBM500",
+    "cp1047": "IBM1047",
+    "cp1140": "IBM01140",
+    "cp273": "IBM273",
+    "cp284": "IBM284",
+    "cp285": "IBM285",
+    "cp297": "IBM297",
+    "utf-8": "UTF-8",
+}
+
+# Zoned decimal byte -> ASCII digit of its low nibble
+_ZONED_TO_ASCII = bytes(0x30 | (b & 0x0F) for b in range(256))
+
+# Binary integer width -> signed struct format code (upper case is unsigned)
+_BINARY_FORMATS = {2: "h", 4: "i", 8: "q"}
+
+# Short values (codes, flags, blank fields) repeat heavily in mainframe
+# data, so decode() memoizes them up to a bounded number of entries
+_DECODE_CACHE_MAX_LEN = 16
+_DECODE_CACHE_MAX_ENTRIES = 4096
+
 
 class EBCDICConverter:
     """
@@ -71,6 +102,7 @@ class EBCDICConverter:
 
         self.codec = codec
         self.ccsid = self._get_ccsid(codec)
+        self._decode_cache: dict[bytes, str] = {}
 
     def _get_ccsid(self, codec: str) -> Optional[int]:
         """Get CCSID for a codec name."""
@@ -92,7 +124,60 @@ class EBCDICConverter:
         """
         if data is None:
             return ""
-        return data.decode(self.codec, errors=errors)
+
+        # Only cache the default error mode, keyed by the raw bytes
+        if errors != "replace" or len(data) > _DECODE_CACHE_MAX_LEN or not isinstance(data, bytes):
+            return data.decode(self.codec, errors=errors)
+
+        text = self._decode_cache.get(data)
+        if text is None:
+            text = data.decode(self.codec, errors=errors)
+            if len(self._decode_cache) < _DECODE_CACHE_MAX_ENTRIES:
+                self._decode_cache[data] = text
+        return text
+
+    def decode_fixed(
+        self,
+        data: bytes,
+        count: int,
+        width: int,
+        errors: str = "replace",
+    ) -> list[str]:
+        """
+        Decode a run of fixed-width EBCDIC fields.
+
+        For single-byte codecs the whole buffer is decoded in one call and
+        split at field boundaries; other codecs decode field by field.
+
+        Args:
+            data: Concatenated field bytes
+            count: Number of fields
+            width: Width of each field in bytes
+            errors: Error handling ('strict', 'replace', 'ignore')
+
+        Returns:
+            List of decoded strings, one per field
+
+        Raises:
+            ValueError: If width is not positive or the data length is
+                not count * width
+        """
+        if width <= 0:
+            raise ValueError(f"Field width must be positive, got {width}")
+        if len(data) != count * width:
+            raise ValueError(
+                f"Data length {len(data)} does not match {count} fields of width {width}"
+            )
+
+        # Offsets only line up when every byte decodes to exactly one char
+        if self.codec in _SBCS_CODECS and errors in ("strict", "replace"):
+            text = data.decode(self.codec, errors=errors)
+            return [text[i:i + width] for i in range(0, len(text), width)]
+
+        return [
+            bytes(data[i:i + width]).decode(self.codec, errors=errors)
+            for i in range(0, len(data), width)
+        ]
 
     def encode(self, text: str, errors: str = "replace") -> bytes:
         """
@@ -135,29 +220,27 @@ class EBCDICConverter:
         if not data:
             return Decimal(0)
 
-        # Extract digits
-        digits = []
-        for byte in data[:-1]:
-            digits.append(byte >> 4)
-            digits.append(byte & 0x0F)
-
-        # Last byte: high nibble is digit, low nibble is sign
-        digits.append(data[-1] >> 4)
+        # Every nibble but the last is a BCD digit, so the hex form of the
+        # bytes is the digit string followed by the sign nibble
+        hex_str = data.hex()
+        num_str = hex_str[:-1]
         sign_nibble = data[-1] & 0x0F
 
-        # Build number string
-        num_str = "".join(str(d) for d in digits)
-
-        # Insert decimal point
-        if scale > 0:
-            if len(num_str) <= scale:
-                num_str = "0" * (scale - len(num_str) + 1) + num_str
-            num_str = num_str[:-scale] + "." + num_str[-scale:]
+        # Invalid digit nibbles (A-F) decode to their two-digit values
+        if not num_str.isdigit():
+            num_str = "".join(str(int(c, 16)) for c in num_str)
 
         # Apply sign (D = negative)
         if sign_nibble == 0x0D:
             num_str = "-" + num_str
 
+        # Scale via the exponent rather than inserting a decimal point. The
+        # string constructor is kept over Decimal((sign, digits, exp)): it is
+        # faster here once the digits are already a str, and it accepts the
+        # multi-digit values of invalid nibbles above
+        if scale > 0:
+            num_str = f"{num_str}E-{scale}"
+
         return Decimal(num_str)
 
     def encode_packed_decimal(
@@ -177,8 +260,8 @@ class EBCDICConverter:
         Returns:
             Packed decimal bytes
         """
-        # Determine sign
-        sign = 0x0C if value >= 0 else 0x0D
+        # Determine sign nibble
+        sign = "c" if value >= 0 else "d"
         value = abs(value)
 
         # Scale to integer
@@ -186,25 +269,14 @@ class EBCDICConverter:
             value = value * (10 ** scale)
         value = int(value)
 
-        # Convert to digit string, pad to precision
+        # Convert to digit string, pad to precision, and keep an odd digit
+        # count so the digits plus sign nibble fill whole bytes
         digits = str(value).zfill(precision)
-
-        # Pack digits into bytes
-        result = bytearray()
-        for i in range(0, len(digits) - 1, 2):
-            high = int(digits[i])
-            low = int(digits[i + 1]) if i + 1 < len(digits) else 0
-            result.append((high << 4) | low)
-
-        # Last digit and sign
         if len(digits) % 2 == 0:
-            last_digit = int(digits[-1])
-            result.append((last_digit << 4) | sign)
-        else:
-            # Odd number of digits, just add sign nibble
-            result[-1] = (result[-1] & 0xF0) | sign
+            digits = "0" + digits
 
-        return bytes(result)
+        # Each digit is one BCD nibble, so the packed bytes are the hex form
+        return bytes.fromhex(digits + sign)
 
     def decode_zoned_decimal(
         self,
@@ -229,31 +301,22 @@ class EBCDICConverter:
         if not data:
             return Decimal(0)
 
-        # Extract digits and sign
-        digits = []
-        sign = 1
+        # Low nibble of each byte is the digit; map them to ASCII in one pass
+        num_str = data.translate(_ZONED_TO_ASCII).decode("ascii")
 
-        for i, byte in enumerate(data):
-            zone = byte >> 4
-            digit = byte & 0x0F
-            digits.append(str(digit))
+        # Invalid digit nibbles (A-F) decode to their two-digit values
+        if not num_str.isdigit():
+            num_str = "".join(str(byte & 0x0F) for byte in data)
 
-            # Check sign in last byte
-            if i == len(data) - 1:
-                if zone == 0x0D:
-                    sign = -1
-
-        # Build number string
-        num_str = "".join(digits)
+        # Zone of the last byte carries the sign (D = negative)
+        if data[-1] >> 4 == 0x0D:
+            num_str = "-" + num_str
 
-        # Insert decimal point
+        # Scale via the exponent rather than inserting a decimal point
         if scale > 0:
-            if len(num_str) <= scale:
-                num_str = "0" * (scale - len(num_str) + 1) + num_str
-            num_str = num_str[:-scale] + "." + num_str[-scale:]
+            num_str = f"{num_str}E-{scale}"
 
-        result = Decimal(num_str)
-        return result * sign
+        return Decimal(num_str)
 
     def decode_binary(
         self,
@@ -275,12 +338,57 @@ class EBCDICConverter:
 
         return int.from_bytes(data, byteorder="big", signed=signed)
 
+    def decode_binary_batch(
+        self,
+        data: bytes,
+        width: int,
+        signed: bool = True,
+    ) -> list[int]:
+        """
+        Decode a run of fixed-width binary integers (COMP/COMP-4/COMP-5).
+
+        Halfword, fullword and doubleword runs are unpacked in a single
+        struct call; other widths are decoded one value at a time.
+
+        Args:
+            data: Concatenated binary values (big-endian)
+            width: Width of each value in bytes
+            signed: Whether to interpret as signed
+
+        Returns:
+            List of Python integers
+
+        Raises:
+            ValueError: If width is not positive or the data length is
+                not a multiple of width
+        """
+        if width <= 0:
+            raise ValueError(f"Value width must be positive, got {width}")
+        count, remainder = divmod(len(data), width)
+        if remainder:
+            raise ValueError(f"Data length {len(data)} is not a multiple of width {width}")
+
+        code = _BINARY_FORMATS.get(width)
+        if code:
+            if not signed:
+                code = code.upper()
+            return list(struct.unpack(f">{count}{code}", data))
+
+        return [
+            int.from_bytes(data[i:i + width], byteorder="big", signed=signed)
+            for i in range(0, len(data), width)
+        ]
+
 
 def convert_ebcdic_column(df, column_name: str, codec: str = "cp037"):
     """
     Convert an EBCDIC column in a DataFrame to UTF-8.
 
-    This function is designed for use with PySpark DataFrames.
+    This function is designed for use with PySpark DataFrames. Binary
+    columns are decoded inside the JVM when the codec has a Java charset,
+    and in Arrow batches via a pandas UDF otherwise. Non-binary columns are
+    converted with Python's str(), using a Spark cast only for string and
+    integral types where the two agree.
 
     Args:
         df: PySpark DataFrame
@@ -290,17 +398,45 @@ def convert_ebcdic_column(df, column_name: str, codec: str = "cp037"):
     Returns:
         DataFrame with converted column
     """
-    from pyspark.sql.functions import udf
-    from pyspark.sql.types import StringType
+    from pyspark.sql import functions as F
+    from pyspark.sql.types import (
+        BinaryType,
+        ByteType,
+        IntegerType,
+        LongType,
+        ShortType,
+        StringType,
+    )
+
+    column = df[column_name]
+    data_type = df.schema[column_name].dataType
+    if isinstance(data_type, (StringType, ByteType, ShortType, IntegerType, LongType)):
+        return df.withColumn(column_name, column.cast(StringType()))
+
+    if not isinstance(data_type, BinaryType):
+        # Spark formats booleans, floats and datetimes differently from str()
+        @F.udf(StringType())
+        def to_string(data):
+            return None if data is None else str(data)
+
+        return df.withColumn(column_name, to_string(column))
 
     converter = EBCDICConverter(codec)
 
-    @udf(StringType())
-    def ebcdic_to_utf8(data):
-        if data is None:
-            return None
-        if isinstance(data, bytes):
-            return converter.decode(data)
-        return str(data)
-
-    return df.withColumn(column_name, ebcdic_to_utf8(df[column_name]))
+    charset = _JAVA_CHARSETS.get(converter.codec)
+    if charset:
+        return df.withColumn(column_name, F.decode(column, charset))
+
+    try:
+        @F.pandas_udf(StringType())
+        def ebcdic_to_utf8(data):
+            return data.map(lambda value: None if value is None else converter.decode(value))
+    except ImportError:
+        # pandas/pyarrow not installed, decode row by row
+        @F.udf(StringType())
+        def ebcdic_to_utf8(data):
+            if data is None:
+                return None
+            return converter.decode(bytes(data))
+
+    return df.withColumn(column_name, ebcdic_to_utf8(column))
@@ -10,13 +10,26 @@ Example:
 """
 
 import os
+import mmap
 import shutil
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Optional
 import json
 
 
+# Read size for hashing files when hashlib.file_digest is unavailable
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Copybook file extensions, in lookup order
+COPYBOOK_EXTENSIONS = (".cpy", ".cob", ".cbl", ".copy")
+
+# Files at least this large are memory-mapped when hashing a directory
+MMAP_THRESHOLD = 64 * 1024
+
+
 def clean_output(path: str) -> bool:
     """
     Remove output directory if it exists.
@@ -54,43 +67,122 @@ def get_file_checksum(filepath: str, algorithm: str = "md5") -> str:
     Returns:
         Hexadecimal checksum string
     """
-    hash_func = getattr(hashlib, algorithm)()
-
     with open(filepath, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        # Python 3.11+: hash with a large internal buffer, GIL released
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, algorithm).hexdigest()
+
+        hash_func = getattr(hashlib, algorithm)()
+        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
             hash_func.update(chunk)
 
     return hash_func.hexdigest()
 
 
-def get_directory_checksum(directory: str, algorithm: str = "md5") -> str:
+def get_directory_checksum(
+    directory: str,
+    algorithm: str = "md5",
+    max_workers: Optional[int] = None,
+) -> str:
     """
     Calculate combined checksum of all files in a directory.
 
+    Files are hashed concurrently, then each file's relative path and
+    digest are combined in relative path order, so renames change the
+    checksum.
+
     Args:
         directory: Path to the directory
         algorithm: Hash algorithm
+        max_workers: Number of hashing threads (default: ThreadPoolExecutor's)
 
     Returns:
-        Hexadecimal checksum string
+        Hexadecimal checksum string; a missing directory gives the
+        checksum of no files
     """
-    hash_func = getattr(hashlib, algorithm)()
+    files = _list_files(directory)
+
+    # hashlib releases the GIL while hashing, so threads run in parallel
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests = executor.map(_hash_file, [path for _, path in files], repeat(algorithm))
 
-    for root, dirs, files in sorted(os.walk(directory)):
-        for filename in sorted(files):
-            filepath = os.path.join(root, filename)
-            with open(filepath, "rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hash_func.update(chunk)
+        hash_func = getattr(hashlib, algorithm)()
+        for (rel_path, _), digest in zip(files, digests):
+            hash_func.update(rel_path.encode("utf-8", "surrogateescape") + b"\0")
+            hash_func.update(digest)
 
     return hash_func.hexdigest()
 
 
+def _hash_file(filepath: str, algorithm: str) -> bytes:
+    """
+    Calculate the raw digest of a file.
+
+    Args:
+        filepath: Path to the file
+        algorithm: Hash algorithm
+
+    Returns:
+        Digest bytes
+    """
+    hash_func = getattr(hashlib, algorithm)()
+
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            # Hash the mapped file in one call, without copying it
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hash_func.update(mm)
+        else:
+            hash_func.update(f.read())
+
+    return hash_func.digest()
+
+
+def _list_files(directory: str) -> list[tuple[str, str]]:
+    """
+    List all files below a directory, sorted by relative path.
+
+    Like os.walk, symlinked directories are not descended into and
+    directories that cannot be listed are skipped, so a missing or
+    non-directory path yields no files.
+
+    Args:
+        directory: Path to the directory
+
+    Returns:
+        List of (relative_path, path) tuples using "/" separators
+    """
+    files = []
+    pending = [(directory, "")]
+
+    while pending:
+        current, prefix = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                rel_path = prefix + entry.name
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending.append((entry.path, rel_path + "/"))
+                else:
+                    files.append((rel_path, entry.path))
+
+    files.sort()
+    return files
+
+
 def count_json_records(directory: str) -> int:
     """
     Count total records in JSON files in a directory.
 
-    Works with Spark-generated JSON output (one JSON per line).
+    Works with Spark-generated JSON output (one JSON per line). Records
+    are counted as newlines, plus a final line without one, so blank
+    lines (which Spark never writes) are counted too.
 
     Args:
         directory: Path to directory containing JSON files
@@ -100,10 +192,13 @@ def count_json_records(directory: str) -> int:
     """
     count = 0
     for filepath in Path(directory).glob("*.json"):
-        with open(filepath, "r") as f:
-            for line in f:
-                if line.strip():
-                    count += 1
+        with open(filepath, "rb") as f:
+            last = b"\n"
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
+                count += chunk.count(b"\n")
+                last = chunk[-1:]
+            if last != b"\n":
+                count += 1
     return count
 
 
@@ -122,16 +217,16 @@ def list_data_files(
         List of file paths
     """
     extensions = extensions or [".ps", ".dat", ".vsam", ".eb"]
+    suffixes = tuple(ext.lower() for ext in extensions)
     files = []
 
-    for entry in os.scandir(directory):
-        if entry.is_file():
-            if extensions is None or any(
-                entry.name.lower().endswith(ext.lower()) for ext in extensions
-            ):
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(suffixes) and entry.is_file():
                 files.append(entry.path)
 
-    return sorted(files)
+    files.sort()
+    return files
 
 
 def list_copybooks(directory: str) -> list[str]:
@@ -144,8 +239,7 @@ def list_copybooks(directory: str) -> list[str]:
     Returns:
         List of copybook file paths
     """
-    extensions = [".cpy", ".cob", ".cbl", ".copy"]
-    return list_data_files(directory, extensions)
+    return list_data_files(directory, list(COPYBOOK_EXTENSIONS))
 
 
 def list_ddl_files(directory: str) -> list[str]:
@@ -231,6 +325,8 @@ def find_matching_copybook(
     Find a matching copybook for a data file based on naming convention.
 
     Tries various naming patterns to match data files with copybooks.
+    Each name is tried as is and uppercased; names that differ only in
+    case are matched last.
 
     Args:
         data_file: Path to the data file
@@ -250,16 +346,41 @@ def find_matching_copybook(
     potential_names.append(data_name)
     potential_names.extend(parts)
 
-    # Look for matching copybook
+    # Look for matching copybook, as named and then uppercased
+    names = _directory_entries(copybook_dir)
     for name in potential_names:
-        for ext in [".cpy", ".cob", ".cbl", ".copy"]:
-            copybook_path = os.path.join(copybook_dir, f"{name}{ext}")
-            if os.path.exists(copybook_path):
-                return copybook_path
-
-            # Try uppercase
-            copybook_path = os.path.join(copybook_dir, f"{name.upper()}{ext}")
-            if os.path.exists(copybook_path):
-                return copybook_path
+        upper_name = name.upper()
+        for ext in COPYBOOK_EXTENSIONS:
+            for candidate in (f"{name}{ext}", f"{upper_name}{ext}"):
+                if candidate in names:
+                    return os.path.join(copybook_dir, candidate)
+
+    # Fall back to ignoring case, as lookups on case-insensitive
+    # filesystems do; the first name in sort order wins a tie
+    folded = {}
+    for entry in sorted(names):
+        folded.setdefault(entry.lower(), entry)
+    for name in potential_names:
+        for ext in COPYBOOK_EXTENSIONS:
+            real_name = folded.get(f"{name}{ext}".lower())
+            if real_name is not None:
+                return os.path.join(copybook_dir, real_name)
 
     return None
+
+
+def _directory_entries(directory: str) -> set[str]:
+    """
+    List the entry names of a directory.
+
+    Args:
+        directory: Path to the directory
+
+    Returns:
+        Set of entry names (empty if the directory cannot be read)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
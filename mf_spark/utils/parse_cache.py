@@ -0,0 +1,171 @@
+"""
+Parse Result Cache.
+
+Persists parsed definition files (copybooks, DCLGEN output) on disk so
+repeated runs against unchanged files skip parsing entirely.
+
+Entries are keyed on the resolved file path, its modification time and
+size, and any parser options that affect the result. Each key also
+covers the package version and the source of the modules that produce
+the cached objects, so a parser change invalidates its old entries.
+
+Example:
+    >>> cache = ParseCache("copybook", modules=[__name__])
+    >>> key = cache.key(Path("CUSTREC.cpy"), False, "cp037")
+    >>> fields = cache.get(key)
+    >>> if fields is None:
+    ...     fields = parser.parse_content(content)
+    ...     cache.put(key, fields)
+"""
+
+import os
+import sys
+import pickle
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from mf_spark import __version__
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user cache directory ($XDG_CACHE_HOME/mf_spark)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mf_spark"
+
+
+class ParseCache:
+    """
+    Pickle-based on-disk cache for parser results.
+
+    The cache directory is created with mode 0700 and is ignored unless it
+    belongs to the current user and is closed to everyone else, since
+    entries are unpickled.
+    Any failure to read or write an entry is treated as a cache miss.
+
+    Attributes:
+        namespace: Prefix separating entries of different parsers
+        cache_dir: Directory holding the cache entries
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        modules: Iterable[str] = (),
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Initialize the parse cache.
+
+        Args:
+            namespace: Prefix separating entries of different parsers
+            modules: Names of the modules whose source determines the
+                cached objects
+            cache_dir: Cache directory (default: $XDG_CACHE_HOME/mf_spark)
+        """
+        self.namespace = namespace
+        self.modules = tuple(modules)
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self._fingerprint: Optional[str] = None
+
+    def key(self, path: Path, *options: Any) -> Optional[str]:
+        """
+        Build the cache key for a file and parser options.
+
+        Args:
+            path: Path to the source file
+            *options: Parser options that affect the parse result
+
+        Returns:
+            Hex digest key, or None if the file cannot be stat'ed
+        """
+        try:
+            stat = path.stat()
+            resolved = path.resolve()
+            fingerprint = self.fingerprint()
+        except OSError:
+            return None
+
+        parts = [
+            fingerprint,
+            self.namespace,
+            resolved,
+            stat.st_mtime_ns,
+            stat.st_size,
+            *options,
+        ]
+        raw = "|".join(str(p) for p in parts)
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+
+    def fingerprint(self) -> str:
+        """
+        Hash the package version and the source of the cached modules.
+
+        Returns:
+            Hex digest, computed once per cache instance
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(__version__.encode("utf-8"), digest_size=20)
+            for name in self.modules:
+                digest.update(Path(sys.modules[name].__file__).read_bytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        """
+        Load a cached parse result.
+
+        Args:
+            key: Key returned by key()
+
+        Returns:
+            Cached object, or None on a miss
+        """
+        if key is None or not self._is_trusted_dir():
+            return None
+
+        try:
+            return pickle.loads((self.cache_dir / f"{key}.pkl").read_bytes())
+        except Exception:
+            return None
+
+    def put(self, key: Optional[str], value: Any) -> None:
+        """
+        Store a parse result, writing atomically.
+
+        Args:
+            key: Key returned by key()
+            value: Picklable parse result
+        """
+        if key is None:
+            return
+
+        try:
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_trusted_dir():
+                return
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self.cache_dir / f"{key}.pkl")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception:
+            # Caching is best-effort
+            pass
+
+    def _is_trusted_dir(self) -> bool:
+        """Check the cache directory is private to the current user."""
+        try:
+            stat = self.cache_dir.stat()
+        except OSError:
+            return False
+
+        getuid = getattr(os, "getuid", None)
+        if getuid is None:
+            return True
+        return stat.st_uid == getuid() and not stat.st_mode & 0o077
@@ -0,0 +1,34 @@
+"""
+Spark Type Lookup.
+
+Shared, memoized conversion from mainframe type strings (COBOL PIC
+clauses, DB2 SQL types) to Spark types for the schema builders in the
+parsers.
+
+Example:
+    >>> converter = DB2TypeConverter()
+    >>> spark_type(converter, "DECIMAL(15,2)")
+    DecimalType(15,2)
+"""
+
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=1024)
+def spark_type(converter: Any, type_def: str) -> Any:
+    """
+    Convert a type string to a Spark type, caching the result.
+
+    Spark types are immutable, so one instance is shared by every field
+    of the same type. Entries are keyed on the converter instance as
+    well as the type string, since converters can be configured.
+
+    Args:
+        converter: VSAMTypeConverter or DB2TypeConverter
+        type_def: PIC clause or DB2 type definition
+
+    Returns:
+        Spark DataType
+    """
+    return converter.convert(type_def)
@@ -10,12 +10,19 @@ Example:
     >>> print(result.summary())
 """
 
+import operator
+from contextlib import contextmanager
+from functools import reduce
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Iterator, Optional, Any
 from datetime import datetime
 
+from pyspark import StorageLevel
+from pyspark.sql import functions as F
+from pyspark.sql.types import BinaryType, StringType
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of a data validation operation.
@@ -76,19 +83,17 @@ class ValidationResult:
 
         if self.null_counts:
             lines.append("\nNull Counts:")
-            for col, count in sorted(self.null_counts.items()):
-                if count > 0:
-                    lines.append(f"  {col}: {count:,}")
+            # Drop zero counts before sorting rather than after
+            nonzero = sorted((col, count) for col, count in self.null_counts.items() if count > 0)
+            lines.extend(f"  {col}: {count:,}" for col, count in nonzero)
 
         if self.errors:
             lines.append("\nErrors:")
-            for err in self.errors:
-                lines.append(f"  - {err}")
+            lines.extend(f"  - {err}" for err in self.errors)
 
         if self.warnings:
             lines.append("\nWarnings:")
-            for warn in self.warnings:
-                lines.append(f"  - {warn}")
+            lines.extend(f"  - {warn}" for warn in self.warnings)
 
         lines.append("=" * 60)
         return "\n".join(lines)
@@ -117,6 +122,8 @@ class DataValidator:
         self,
         null_threshold: float = 0.5,
         count_tolerance: float = 0.0,
+        approximate: bool = False,
+        sample_fraction: float = 0.01,
     ):
         """
         Initialize the data validator.
@@ -124,9 +131,15 @@ class DataValidator:
         Args:
             null_threshold: Warn if null percentage exceeds this (0.0-1.0)
             count_tolerance: Allowed variance from expected count (0.0-1.0)
+            approximate: Estimate null counts from a sample, so null
+                percentage warnings are probabilistic. Non-null column
+                checks always use exact counts.
+            sample_fraction: Fraction of rows sampled in approximate mode
         """
         self.null_threshold = null_threshold
         self.count_tolerance = count_tolerance
+        self.approximate = approximate
+        self.sample_fraction = sample_fraction
 
     def validate(
         self,
@@ -149,23 +162,26 @@ class DataValidator:
         """
         result = ValidationResult()
 
-        # Get record count
-        result.record_count = df.count()
+        # Each check below is a separate Spark action, so compute df once
+        with _cached(df) as df:
+            # Get record count (materializes the cache). DataFrame.count() is
+            # kept over df.rdd.count(), which would ship every row to Python
+            result.record_count = df.count()
 
-        # Validate expected count
-        if expected_count is not None:
-            result.expected_count = expected_count
-            self._validate_count(result, expected_count)
+            # Validate expected count
+            if expected_count is not None:
+                result.expected_count = expected_count
+                self._validate_count(result, expected_count)
 
-        # Validate required columns
-        if required_columns:
-            self._validate_required_columns(result, df, required_columns)
+            # Validate required columns
+            if required_columns:
+                self._validate_required_columns(result, df, required_columns)
 
-        # Check for nulls
-        self._validate_nulls(result, df, non_null_columns)
+            # Check for nulls
+            self._validate_nulls(result, df, non_null_columns)
 
-        # Calculate metrics
-        result.metrics = self._calculate_metrics(df)
+            # Calculate metrics
+            result.metrics = self._calculate_metrics(df)
 
         return result
 
@@ -211,63 +227,98 @@ class DataValidator:
         non_null_columns: Optional[list[str]],
     ) -> None:
         """Check for null values in DataFrame."""
-        from pyspark.sql.functions import col, count, when, isnan
-
         total_count = result.record_count
         if total_count == 0:
             return
 
-        # Count nulls for all columns
-        for column in df.columns:
-            try:
-                null_count = df.filter(
-                    col(column).isNull() |
-                    (col(column) == "") |
-                    (col(column).cast("string") == "null")
-                ).count()
-
-                result.null_counts[column] = null_count
-
-                # Check threshold
-                null_pct = null_count / total_count
-                if null_pct > self.null_threshold:
-                    result.add_warning(
-                        f"High null percentage in {column}: "
-                        f"{null_pct:.1%} ({null_count:,}/{total_count:,})"
-                    )
-
-                # Check non-null constraint
-                if non_null_columns and column in non_null_columns and null_count > 0:
-                    result.add_error(
-                        f"Non-null column {column} contains {null_count:,} nulls"
-                    )
-            except Exception:
-                # Skip columns that can't be checked
-                pass
+        fields = df.schema.fields
+        if not fields:
+            return
 
-    def _calculate_metrics(self, df: Any) -> dict[str, Any]:
-        """Calculate additional data quality metrics."""
-        metrics = {
-            "column_count": len(df.columns),
-            "columns": df.columns,
-        }
+        non_null = set(non_null_columns or ())
+        if self.approximate:
+            null_counts = self._estimate_null_counts(df, fields, total_count, non_null)
+        else:
+            null_counts = _count_nulls(df, fields)
+
+        for column, null_count in zip(df.columns, null_counts):
+            if null_count is None:
+                result.add_warning(f"Could not check nulls in {column}")
+                continue
 
+            result.null_counts[column] = null_count
+
+            # Check threshold
+            null_pct = null_count / total_count
+            if null_pct > self.null_threshold:
+                result.add_warning(
+                    f"High null percentage in {column}: "
+                    f"{null_pct:.1%} ({null_count:,}/{total_count:,})"
+                )
+
+            # Check non-null constraint
+            if column in non_null and null_count > 0:
+                result.add_error(
+                    f"Non-null column {column} contains {null_count:,} nulls"
+                )
+
+    def _estimate_null_counts(
+        self,
+        df: Any,
+        fields: list[Any],
+        total_count: int,
+        non_null: set[str],
+    ) -> list[Optional[int]]:
+        """
+        Estimate per-column null counts by extrapolating from a sample.
+
+        Columns in non_null are counted exactly, as are all columns if the
+        sample comes back empty or cannot be aggregated.
+
+        Args:
+            df: PySpark DataFrame
+            fields: StructFields of the columns to count
+            total_count: Exact record count of df
+            non_null: Names of columns that must not contain nulls
+
+        Returns:
+            Null count per field, in field order (None if uncountable)
+        """
+        sample = df.sample(fraction=self.sample_fraction, seed=42)
         try:
-            # Get schema info
-            schema_info = {}
-            for field in df.schema.fields:
-                schema_info[field.name] = str(field.dataType)
-            metrics["schema"] = schema_info
+            row = sample.agg(F.count(F.lit(1)), *[_null_count(f) for f in fields]).first()
         except Exception:
-            pass
+            return _count_nulls(df, fields)
+
+        sampled = row[0]
+        if not sampled:
+            return _count_nulls(df, fields)
 
-        return metrics
+        null_counts = [round(n * total_count / sampled) for n in row[1:]]
+
+        exact = [i for i, f in enumerate(fields) if f.name in non_null]
+        if exact:
+            exact_counts = _count_nulls(df, [fields[i] for i in exact])
+            for i, null_count in zip(exact, exact_counts):
+                null_counts[i] = null_count
+
+        return null_counts
+
+    def _calculate_metrics(self, df: Any) -> dict[str, Any]:
+        """Calculate additional data quality metrics."""
+        fields = df.schema.fields
+        return {
+            "column_count": len(fields),
+            "columns": tuple(f.name for f in fields),
+            "schema": {f.name: str(f.dataType) for f in fields},
+        }
 
     def validate_checksum(
         self,
         df: Any,
         checksum_column: str,
         expected_checksum: str,
+        hash_algo: str = "md5",
     ) -> bool:
         """
         Validate data checksum for integrity.
@@ -276,16 +327,26 @@ class DataValidator:
             df: DataFrame to validate
             checksum_column: Column containing checksums
             expected_checksum: Expected checksum value
+            hash_algo: 'md5' (hex digest of the "|"-joined values) or
+                'xxhash64' (much cheaper, non-cryptographic, decimal string)
 
         Returns:
             True if checksum matches
+
+        Raises:
+            ValueError: If hash_algo is not supported
         """
-        from pyspark.sql.functions import md5, concat_ws
+        columns = [df[c] for c in df.columns]
+        if hash_algo == "xxhash64":
+            # Hashes the column values directly, with no string building
+            checksum = F.xxhash64(*columns).cast("string")
+        elif hash_algo == "md5":
+            checksum = F.md5(F.concat_ws("|", *columns))
+        else:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algo}")
 
         # Calculate checksum of all data
-        calculated = df.select(
-            md5(concat_ws("|", *[df[c] for c in df.columns]))
-        ).first()[0]
+        calculated = df.select(checksum).first()[0]
 
         return calculated == expected_checksum
 
@@ -306,32 +367,131 @@ class DataValidator:
         Returns:
             Dictionary with comparison results
         """
-        results = {
-            "df1_count": df1.count(),
-            "df2_count": df2.count(),
-            "matching": 0,
-            "df1_only": 0,
-            "df2_only": 0,
-        }
+        # Both sides are counted and then joined, so compute each once
+        with _cached(df1) as df1, _cached(df2) as df2:
+            results = {
+                "df1_count": df1.count(),
+                "df2_count": df2.count(),
+                "matching": 0,
+                "df1_only": 0,
+                "df2_only": 0,
+            }
+
+            # Perform outer join. Only the keys are needed to classify rows,
+            # so project them first to keep other columns out of the shuffle
+            joined = df1.select(*key_columns).alias("a").join(
+                df2.select(*key_columns).alias("b"),
+                on=key_columns,
+                how="outer"
+            )
+
+            # Count matches and differences in a single aggregation pass. This
+            # is the only action on joined, so caching it would not pay off
+            a_present = _all_of([F.col(f"a.{c}").isNotNull() for c in key_columns])
+            b_present = _all_of([F.col(f"b.{c}").isNotNull() for c in key_columns])
+            a_missing = _all_of([F.col(f"a.{c}").isNull() for c in key_columns])
+            b_missing = _all_of([F.col(f"b.{c}").isNull() for c in key_columns])
+
+            row = joined.agg(
+                F.count(F.when(a_present & b_present, 1)).alias("matching"),
+                F.count(F.when(a_present & b_missing, 1)).alias("df1_only"),
+                F.count(F.when(a_missing & b_present, 1)).alias("df2_only"),
+            ).first()
+
+            results["matching"] = row["matching"]
+            results["df1_only"] = row["df1_only"]
+            results["df2_only"] = row["df2_only"]
+
+        return results
 
-        # Perform outer join
-        joined = df1.alias("a").join(
-            df2.alias("b"),
-            on=key_columns,
-            how="outer"
-        )
 
-        # Count matches and differences
-        results["matching"] = joined.filter(
-            " AND ".join([f"a.{c} IS NOT NULL AND b.{c} IS NOT NULL" for c in key_columns])
-        ).count()
+def _count_nulls(df: Any, fields: list[Any]) -> list[Optional[int]]:
+    """
+    Count null values per column in a single aggregation pass.
 
-        results["df1_only"] = joined.filter(
-            " AND ".join([f"a.{c} IS NOT NULL AND b.{c} IS NULL" for c in key_columns])
-        ).count()
+    If the combined aggregation fails, the columns are counted one at a
+    time so a column that cannot be checked does not hide the others.
 
-        results["df2_only"] = joined.filter(
-            " AND ".join([f"a.{c} IS NULL AND b.{c} IS NOT NULL" for c in key_columns])
-        ).count()
+    Args:
+        df: PySpark DataFrame
+        fields: StructFields of the columns to count
 
-        return results
+    Returns:
+        Null count per field, in field order (None if it failed)
+    """
+    try:
+        return list(df.agg(*[_null_count(f) for f in fields]).first())
+    except Exception:
+        pass
+
+    null_counts = []
+    for f in fields:
+        try:
+            null_counts.append(df.agg(_null_count(f)).first()[0])
+        except Exception:
+            null_counts.append(None)
+    return null_counts
+
+
+def _null_count(field: Any) -> Any:
+    """Build the aggregate counting null values of a column."""
+    return F.sum(F.when(_null_condition(field), 1).otherwise(0))
+
+
+def _null_condition(field: Any) -> Any:
+    """
+    Build the condition for a column value counting as null.
+
+    Strings also count empty and literal "null" values, and binary values
+    count when empty. Other types can only be null, so they need no casts
+    or string comparisons.
+
+    Args:
+        field: StructField of the column
+
+    Returns:
+        Boolean Column expression
+    """
+    column = _column(field.name)
+    if isinstance(field.dataType, StringType):
+        return column.isNull() | (column == "") | (column == "null")
+    if isinstance(field.dataType, BinaryType):
+        return column.isNull() | (F.length(column) == 0)
+    return column.isNull()
+
+
+def _column(name: str) -> Any:
+    """Reference a top-level column, quoting dots and backticks in its name."""
+    return F.col("`" + name.replace("`", "``") + "`")
+
+
+def _all_of(conditions: list[Any]) -> Any:
+    """Combine Column conditions with AND."""
+    return reduce(operator.and_, conditions)
+
+
+@contextmanager
+def _cached(df: Any) -> Iterator[Any]:
+    """
+    Cache a DataFrame for the duration of a block.
+
+    If the plan is already cached, through this DataFrame or any other
+    with the same plan, the cache is left as it is and not dropped on exit.
+
+    Args:
+        df: PySpark DataFrame
+
+    Yields:
+        The cached DataFrame
+    """
+    # storageLevel asks Spark's cache manager; is_cached only knows about
+    # cache() calls on this DataFrame object
+    if df.storageLevel != StorageLevel.NONE:
+        yield df
+        return
+
+    df = df.cache()
+    try:
+        yield df
+    finally:
+        df.unpersist()
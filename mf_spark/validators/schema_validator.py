@@ -20,7 +20,7 @@ from pyspark.sql.types import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaComparisonResult:
     """
     Result of a schema comparison operation.
@@ -127,6 +127,13 @@ class SchemaValidator:
         BooleanType: [BooleanType, StringType, IntegerType],
     }
 
+    # (source_type, target_type) pairs from the matrix, for O(1) lookups
+    _COMPAT_PAIRS = frozenset(
+        (source, target)
+        for source, targets in COMPATIBLE_TYPES.items()
+        for target in targets
+    )
+
     def __init__(
         self,
         allow_missing_in_target: bool = False,
@@ -169,34 +176,26 @@ class SchemaValidator:
         source_dict = {f.name: f for f in source.fields}
         target_dict = {f.name: f for f in target.fields}
 
-        # Find matching, missing, and extra fields
-        source_set = set(result.source_fields)
-        target_set = set(result.target_fields)
+        # Find matching, missing, and extra fields; key views are set-like
+        source_names = source_dict.keys()
+        target_names = target_dict.keys()
 
-        result.matching_fields = list(source_set & target_set)
-        result.missing_in_target = list(source_set - target_set)
-        result.missing_in_source = list(target_set - source_set)
+        # Sort once so results are deterministic
+        result.matching_fields = sorted(source_names & target_names)
+        result.missing_in_target = sorted(source_names - target_names)
+        result.missing_in_source = sorted(target_names - source_names)
 
         # Check compatibility of matching fields
         for field_name in result.matching_fields:
-            source_field = source_dict[field_name]
-            target_field = target_dict[field_name]
+            source_type = source_dict[field_name].dataType
+            target_type = target_dict[field_name].dataType
 
-            is_compatible, is_exact = self._check_type_compatibility(
-                source_field.dataType,
-                target_field.dataType,
-            )
+            is_compatible, is_exact = self._check_type_compatibility(source_type, target_type)
 
             if not is_compatible:
-                result.type_mismatches[field_name] = (
-                    str(source_field.dataType),
-                    str(target_field.dataType),
-                )
+                result.type_mismatches[field_name] = (str(source_type), str(target_type))
             elif not is_exact:
-                result.compatible_changes[field_name] = (
-                    str(source_field.dataType),
-                    str(target_field.dataType),
-                )
+                result.compatible_changes[field_name] = (str(source_type), str(target_type))
 
         # Determine overall compatibility
         result.is_compatible = len(result.type_mismatches) == 0
@@ -248,9 +247,7 @@ class SchemaValidator:
         source_base = type(source_type)
         target_base = type(target_type)
 
-        compatible_targets = self.COMPATIBLE_TYPES.get(source_base, [])
-
-        if target_base in compatible_targets:
+        if (source_base, target_base) in self._COMPAT_PAIRS:
             if self.allow_type_promotion:
                 return True, False
             else:
@@ -275,13 +272,22 @@ class SchemaValidator:
         Returns:
             Tuple of (is_valid, error_messages)
         """
+        if not required_fields and not field_types:
+            return True, []
+
         errors = []
-        field_dict = {f.name: f for f in schema.fields}
+
+        # Names alone suffice unless field types need checking
+        if field_types:
+            field_dict = {f.name: f for f in schema.fields}
+            field_names = field_dict.keys()
+        else:
+            field_names = {f.name for f in schema.fields}
 
         # Check required fields
         if required_fields:
             for field_name in required_fields:
-                if field_name not in field_dict:
+                if field_name not in field_names:
                     errors.append(f"Required field missing: {field_name}")
 
         # Check field types
@@ -315,16 +321,22 @@ class SchemaValidator:
         Returns:
             New StructType for target schema
         """
-        type_mappings = type_mappings or {}
-        column_mappings = column_mappings or {}
+        # Without mappings every field is copied as-is (metadata dropped)
+        if not type_mappings and not column_mappings:
+            return StructType([
+                StructField(f.name, f.dataType, f.nullable) for f in source.fields
+            ])
+
+        get_name = (column_mappings or {}).get
+        get_type = (type_mappings or {}).get
 
         fields = []
         for source_field in source.fields:
             # Apply column name mapping
-            target_name = column_mappings.get(source_field.name, source_field.name)
+            target_name = get_name(source_field.name, source_field.name)
 
             # Apply type mapping
-            target_type = type_mappings.get(source_field.name, source_field.dataType)
+            target_type = get_type(source_field.name, source_field.dataType)
 
             fields.append(StructField(
                 target_name,
@@ -15,6 +15,7 @@ Usage:
     python run_migration.py                    # Run all datasets
     python run_migration.py --dataset customers # Run specific dataset
     python run_migration.py --clean            # Clean output before running
+    python run_migration.py --parallel 4       # Process 4 datasets at a time
 
 Example:
     uv run python run_migration.py
@@ -35,10 +36,12 @@ from mf_spark.config.settings import get_carddemo_config
 
 def clean_output_directory(output_dir: str) -> None:
     """Clean the entire output directory."""
-    if os.path.exists(output_dir):
-        print(f"Cleaning output directory: {output_dir}")
+    # Remove directly instead of checking first; a missing directory is fine
+    try:
         shutil.rmtree(output_dir)
-        print("Output directory cleaned.")
+    except FileNotFoundError:
+        return
+    print(f"Cleaned output directory: {output_dir}")
 
 
 def main():
@@ -71,6 +74,12 @@ def main():
         action="store_true",
         help="Clean output directory before running"
     )
+    parser.add_argument(
+        "--parallel", "-p",
+        type=int,
+        default=1,
+        help="Number of datasets to process concurrently (default: 1)"
+    )
     parser.add_argument(
         "--validate",
         action="store_true",
@@ -109,7 +118,11 @@ def main():
 
     # Run migration
     datasets = [args.dataset] if args.dataset else None
-    results = migrator.run(datasets=datasets, output_format=output_format)
+    results = migrator.run(
+        datasets=datasets,
+        output_format=output_format,
+        max_workers=args.parallel,
+    )
 
     # Return exit code based on results
     summary = migrator.get_summary()
@@ -0,0 +1,41 @@
+"""Tests for the COBOL copybook parser."""
+
+from mf_spark.parsers import CopybookParser
+
+
+def _parse(content: str):
+    return CopybookParser().parse_content(content)
+
+
+def test_child_attaches_to_enclosing_group_with_duplicate_name():
+    fields = _parse(
+        """
+       01 REC.
+           05 GRP.
+              10 GRP PIC X.
+              10 B PIC X.
+           05 C PIC X.
+"""
+    )
+    rec, group, inner, b, c = fields
+
+    assert rec.children == ["GRP", "C"]
+    assert group.is_group and group.children == ["GRP", "B"]
+    assert inner.children == []
+    assert b.parent == "GRP" and b.offset == 1
+    assert c.offset == 2
+
+
+def test_redefines_target_named_like_usage_is_not_comp():
+    fields = _parse(
+        """
+       01 REC.
+           05 COMP-X PIC X(4).
+           05 ALT REDEFINES COMP-X PIC X(4).
+"""
+    )
+    alt = fields[-1]
+
+    assert alt.redefines == "COMP-X"
+    assert alt.pic_clause == "PIC X(4)"
+    assert alt.offset == 0 and alt.length == 4
@@ -0,0 +1,34 @@
+"""Tests for the DB2 DCLGEN parser."""
+
+from mf_spark.parsers import DCLParser
+
+DCLGEN = """
+           EXEC SQL DECLARE CARDDEMO.TRANSACTION_TYPE_CATEGORY TABLE
+           ( TRC_TYPE_CODE                  CHAR(2) NOT NULL,
+             TRC_TYPE_CATEGORY              CHAR(4) NOT NULL,
+             TRC_CAT_DATA                   VARCHAR(50) NOT NULL
+           ) END-EXEC.
+       01  DCLTRANSACTION-TYPE-CATEGORY.
+      *                       TRC_TYPE_CODE
+           10 DCL-TRC-TYPE-CODE    PIC X(2).
+      *                       TRC_TYPE_CATEGORY
+           10 DCL-TRC-TYPE-CATEGORY
+              PIC X(4).
+           10 DCL-TRC-CAT-DATA.
+      *                       TRC_CAT_DATA LENGTH
+              49 DCL-TRC-CAT-DATA-LEN
+                 PIC S9(4) USAGE COMP.
+      *                       TRC_CAT_DATA
+              49 DCL-TRC-CAT-DATA-TEXT
+                 PIC X(50).
+"""
+
+
+def test_pic_clause_on_continuation_line():
+    result = DCLParser().parse_content(DCLGEN)
+    variables = {var.name: var for var in result.host_variables}
+
+    assert result.table_name == "CARDDEMO.TRANSACTION_TYPE_CATEGORY"
+    assert variables["DCL-TRC-TYPE-CODE"].pic_clause == "PIC X(2)"
+    assert variables["DCL-TRC-TYPE-CATEGORY"].pic_clause == "PIC X(4)"
+    assert variables["DCL-TRC-TYPE-CATEGORY"].sql_column == "TRC_TYPE_CATEGORY"
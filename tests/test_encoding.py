@@ -0,0 +1,93 @@
+"""Tests for EBCDIC and COBOL numeric encoding helpers."""
+
+from decimal import Decimal
+
+import pytest
+
+from mf_spark.utils.encoding import EBCDICConverter
+
+
+@pytest.fixture
+def converter():
+    return EBCDICConverter("cp037")
+
+
+def _zoned(value: Decimal, digits: int, scale: int) -> bytes:
+    """Build signed zoned decimal bytes with the sign in the last zone."""
+    text = str(int(abs(value) * 10 ** scale)).zfill(digits)
+    zones = bytearray(0xF0 | int(c) for c in text)
+    zones[-1] = (0xD0 if value < 0 else 0xC0) | (zones[-1] & 0x0F)
+    return bytes(zones)
+
+
+@pytest.mark.parametrize(
+    "value, precision, scale",
+    [
+        (Decimal("0"), 1, 0),
+        (Decimal("7"), 1, 0),
+        (Decimal("-7"), 1, 0),
+        (Decimal("12345"), 5, 0),
+        (Decimal("-12345"), 5, 0),
+        (Decimal("123.45"), 5, 2),
+        (Decimal("-0.01"), 4, 2),
+        (Decimal("1234"), 4, 0),
+        (Decimal("99999999.99"), 10, 2),
+        (Decimal("-0.000001"), 7, 6),
+    ],
+)
+def test_packed_decimal_round_trip(converter, value, precision, scale):
+    packed = converter.encode_packed_decimal(value, precision, scale)
+
+    assert len(packed) == precision // 2 + 1
+    assert converter.decode_packed_decimal(packed, scale) == value
+
+
+def test_packed_decimal_layout(converter):
+    assert converter.encode_packed_decimal(Decimal("12345"), 5) == b"\x12\x34\x5c"
+    assert converter.encode_packed_decimal(Decimal("-1234"), 4) == b"\x01\x23\x4d"
+    assert converter.decode_packed_decimal(b"\x12\x34\x5c", scale=2) == Decimal("123.45")
+
+
+@pytest.mark.parametrize(
+    "value, digits, scale",
+    [
+        (Decimal("0"), 1, 0),
+        (Decimal("42"), 4, 0),
+        (Decimal("-42"), 4, 0),
+        (Decimal("123.45"), 5, 2),
+        (Decimal("-0.07"), 3, 2),
+    ],
+)
+def test_zoned_decimal_round_trip(converter, value, digits, scale):
+    assert converter.decode_zoned_decimal(_zoned(value, digits, scale), scale) == value
+
+
+def test_zoned_decimal_unsigned(converter):
+    assert converter.decode_zoned_decimal(b"\xf1\xf2\xf3") == Decimal("123")
+
+
+def test_decode_fixed(converter):
+    data = "ABCDEF".encode("cp037")
+
+    assert converter.decode_fixed(data, 3, 2) == ["AB", "CD", "EF"]
+    assert converter.decode_fixed(b"", 0, 4) == []
+
+
+@pytest.mark.parametrize("count, width", [(3, 3), (0, 0), (1, -6)])
+def test_decode_fixed_rejects_bad_layout(converter, count, width):
+    with pytest.raises(ValueError):
+        converter.decode_fixed("ABCDEF".encode("cp037"), count, width)
+
+
+def test_decode_binary_batch(converter):
+    data = b"\x00\x01\xff\xfe\x7f\xff"
+
+    assert converter.decode_binary_batch(data, 2) == [1, -2, 32767]
+    assert converter.decode_binary_batch(data, 2, signed=False) == [1, 65534, 32767]
+    assert converter.decode_binary_batch(data, 3) == [0x0001FF, 0xFE7FFF - 0x1000000]
+
+
+@pytest.mark.parametrize("width", [0, -2, 4])
+def test_decode_binary_batch_rejects_bad_width(converter, width):
+    with pytest.raises(ValueError):
+        converter.decode_binary_batch(b"\x00\x01\xff\xfe\x7f\xff", width)
@@ -0,0 +1,84 @@
+"""Tests for file and directory helpers."""
+
+import hashlib
+import math
+
+from mf_spark.utils.file_utils import (
+    find_matching_copybook,
+    get_directory_checksum,
+    load_manifest,
+    save_manifest,
+)
+
+EMPTY_MD5 = hashlib.md5().hexdigest()
+
+
+def test_directory_checksum_of_missing_directory(tmp_path):
+    assert get_directory_checksum(str(tmp_path / "missing")) == EMPTY_MD5
+
+
+def test_directory_checksum_of_file_path(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("{}")
+
+    assert get_directory_checksum(str(path)) == EMPTY_MD5
+
+
+def test_directory_checksum_tracks_renames(tmp_path):
+    (tmp_path / "a.txt").write_text("same")
+    before = get_directory_checksum(str(tmp_path))
+    (tmp_path / "a.txt").rename(tmp_path / "b.txt")
+
+    assert get_directory_checksum(str(tmp_path)) != before
+
+
+def test_find_matching_copybook_ignores_case(tmp_path):
+    (tmp_path / "CustData.cpy").write_text("")
+    (tmp_path / "CARDREC.CPY").write_text("")
+
+    assert find_matching_copybook("custdata.dat", str(tmp_path)) == str(tmp_path / "CustData.cpy")
+    assert find_matching_copybook(
+        "AWS.M2.CARDDEMO.CardRec.PS", str(tmp_path)
+    ) == str(tmp_path / "CARDREC.CPY")
+    assert find_matching_copybook("other.dat", str(tmp_path)) is None
+
+
+def test_find_matching_copybook_prefers_exact_then_uppercase(tmp_path):
+    (tmp_path / "custdata.cpy").write_text("")
+    (tmp_path / "CUSTDATA.cpy").write_text("")
+    (tmp_path / "CustData.cpy").write_text("")
+
+    assert find_matching_copybook("custdata.dat", str(tmp_path)) == str(tmp_path / "custdata.cpy")
+    assert find_matching_copybook("Custdata.dat", str(tmp_path)) == str(tmp_path / "CUSTDATA.cpy")
+    assert find_matching_copybook("CUSTDATA.dat", str(tmp_path)) == str(tmp_path / "CUSTDATA.cpy")
+
+
+def test_find_matching_copybook_case_fallback_is_deterministic(tmp_path):
+    (tmp_path / "custData.CPY").write_text("")
+    (tmp_path / "CustData.CPY").write_text("")
+
+    assert find_matching_copybook("custdata.dat", str(tmp_path)) == str(tmp_path / "CustData.CPY")
+
+
+def test_find_matching_copybook_sees_new_files(tmp_path):
+    assert find_matching_copybook("acct.dat", str(tmp_path)) is None
+    (tmp_path / "ACCT.cpy").write_text("")
+
+    assert find_matching_copybook("acct.dat", str(tmp_path)) == str(tmp_path / "ACCT.cpy")
+
+
+def test_manifest_round_trip(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    data = {"name": "CUSTDATA", "records": 2 ** 70, "ratio": 0.5, "tags": ["é"]}
+    save_manifest(path, data)
+
+    assert load_manifest(path) == data
+
+
+def test_manifest_keeps_non_finite_floats(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    save_manifest(path, {"rate": float("inf"), "ratio": float("nan")})
+    data = load_manifest(path)
+
+    assert data["rate"] == float("inf")
+    assert math.isnan(data["ratio"])
@@ -0,0 +1,51 @@
+"""Tests for parsing several definition files at once."""
+
+import pytest
+
+from mf_spark.parsers import CopybookParser, DCLParser
+from mf_spark.utils import parallel
+
+COPYBOOK = """
+       01 REC-{n}.
+           05 KEY-{n} PIC 9({n}).
+           05 AMT-{n} PIC S9(7)V99 COMP-3.
+           05 TXT-{n} PIC X(10) OCCURS {n}.
+"""
+
+DCLGEN = """
+           EXEC SQL DECLARE CARDDEMO.T{n} TABLE
+           ( ID_{n}                         INTEGER NOT NULL,
+             NAME_{n}                       VARCHAR({n}0)
+           ) END-EXEC.
+       01  DCLT{n}.
+           10 DCL-ID-{n}           PIC S9(9) USAGE COMP.
+           10 DCL-NAME-{n}.
+              49 DCL-NAME-{n}-LEN  PIC S9(4) USAGE COMP.
+              49 DCL-NAME-{n}-TEXT PIC X({n}0).
+"""
+
+
+@pytest.mark.parametrize(
+    "parser, template, suffix",
+    [(CopybookParser(), COPYBOOK, ".cpy"), (DCLParser(), DCLGEN, ".dcl")],
+)
+def test_process_pool_matches_inline_parsing(tmp_path, monkeypatch, parser, template, suffix):
+    paths = []
+    for n in (3, 1, 4, 2, 5):
+        path = tmp_path / f"F{n}{suffix}"
+        path.write_text(template.format(n=n))
+        paths.append(str(path))
+
+    inline = parser.parse_files(paths)
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_BYTES", 0)
+    pooled = parser.parse_files(paths, max_workers=2)
+
+    assert list(pooled) == paths
+    assert pooled == inline
+
+
+def test_missing_file_is_reported(tmp_path, monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_BYTES", 0)
+
+    with pytest.raises(FileNotFoundError):
+        CopybookParser().parse_files([str(tmp_path / "A.cpy"), str(tmp_path / "B.cpy")])